@@ -9,17 +9,124 @@
 |
 """
 
+import concurrent.futures
+import datetime
+import functools
+import hashlib
+import itertools
+
 from ... import pattern_visitor
 from ...version import DEFAULT_VERSION
-from .compare.observation import observation_expression_cmp
+from .compare.observation import observation_expression_key
 from .transform import ChainTransformer, SettleTransformer
 from .transform.observation import (
-    AbsorptionTransformer, DNFTransformer, FlattenTransformer,
-    NormalizeComparisonExpressionsTransformer, OrderDedupeTransformer,
+    DNFTransformer, FusedSimplifyTransformer,
+    NormalizeComparisonExpressionsTransformer,
 )
 
-# Lazy-initialize
-_pattern_normalizer = None
+# Search pattern and its normalized form, used by find_equivalent_patterns()
+# worker processes.  Set once per worker by _init_match_worker().
+_worker_search_pattern = None
+_worker_norm_search_pattern = None
+
+# Patterns per task sent to a find_equivalent_patterns() worker, and tasks per
+# worker submitted at a time.  Bounds the work queued ahead of the consumer.
+_MATCH_CHUNKSIZE = 32
+_MATCH_BATCH_CHUNKS = 4
+
+
+def _encode_key_value(value):
+    """
+    Encode a primitive value from a comparison key as bytes, for
+    fingerprinting.  Values which compare equal must encode identically.
+
+    Args:
+        value: A str, bytes, int, bool, float or datetime value
+
+    Returns:
+        The encoded value, prefixed with a one-byte type tag
+    """
+    if isinstance(value, str):
+        result = b"s" + value.encode("utf-8")
+
+    elif isinstance(value, bytes):
+        result = b"b" + value
+
+    # Includes bools, which compare equal to ints
+    elif isinstance(value, int):
+        result = b"i" + str(int(value)).encode("ascii")
+
+    elif isinstance(value, float):
+        if value.is_integer():
+            result = b"i" + str(int(value)).encode("ascii")
+        else:
+            result = b"f" + value.hex().encode("ascii")
+
+    elif isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        result = b"d" + value.isoformat().encode("ascii")
+
+    else:
+        raise TypeError(
+            "Can't fingerprint value of type " + type(value).__name__,
+        )
+
+    return result
+
+
+def _key_fingerprint(key):
+    """
+    Compute a 128-bit Merkle-style fingerprint of a comparison key.  Each
+    tuple is hashed from its length and its elements: encoded primitive
+    values, or the fingerprints of nested tuples.  Equal keys always have
+    equal fingerprints; unequal keys almost always have unequal ones.
+
+    Args:
+        key: A comparison key, as returned from observation_expression_key()
+
+    Returns:
+        The fingerprint, as bytes
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(b"t" + str(len(key)).encode("ascii"))
+
+    for value in key:
+        if isinstance(value, tuple):
+            hasher.update(_key_fingerprint(value))
+        else:
+            encoded = _encode_key_value(value)
+            hasher.update(len(encoded).to_bytes(8, "big"))
+            hasher.update(encoded)
+
+    return hasher.digest()
+
+
+def _build_pattern_normalizer():
+    """
+    Build a normalization transformer for STIX patterns.
+
+    Returns:
+        The transformer
+    """
+    normalize_comp_expr = \
+        NormalizeComparisonExpressionsTransformer()
+
+    obs_simplify = FusedSimplifyTransformer()
+    obs_settle_simplify = SettleTransformer(obs_simplify)
+
+    obs_dnf = DNFTransformer()
+
+    return ChainTransformer(
+        normalize_comp_expr,
+        obs_settle_simplify, obs_dnf, obs_settle_simplify,
+    )
+
+
+# The transformers are either stateless or contain no state which changes
+# with each use.  So we can set them up once, at import time, and keep
+# reusing them from any thread.
+_PATTERN_NORMALIZER = _build_pattern_normalizer()
 
 
 def _get_pattern_normalizer():
@@ -29,32 +136,49 @@ def _get_pattern_normalizer():
     Returns:
         The transformer
     """
+    return _PATTERN_NORMALIZER
 
-    # The transformers are either stateless or contain no state which changes
-    # with each use.  So we can setup the transformers once and keep reusing
-    # them.
-    global _pattern_normalizer
 
-    if not _pattern_normalizer:
-        normalize_comp_expr = \
-            NormalizeComparisonExpressionsTransformer()
+@functools.lru_cache(maxsize=1024)
+def _normalize_pattern(pattern, stix_version):
+    """
+    Parse and normalize a STIX pattern, and lower the result to a comparison
+    key.  Results are cached by pattern string and STIX version, so repeated
+    patterns skip the parse and transform steps.
 
-        obs_expr_flatten = FlattenTransformer()
-        obs_expr_order = OrderDedupeTransformer()
-        obs_expr_absorb = AbsorptionTransformer()
-        obs_simplify = ChainTransformer(
-            obs_expr_flatten, obs_expr_order, obs_expr_absorb,
-        )
-        obs_settle_simplify = SettleTransformer(obs_simplify)
+    Args:
+        pattern: A STIX pattern as a string
+        stix_version: The STIX version to use for pattern parsing, as a string
+            ("2.0", "2.1", etc).
 
-        obs_dnf = DNFTransformer()
+    Returns:
+        The comparison key.  Two patterns are equivalent if and only if their
+        keys are equal.  See observation_expression_key().
+    """
+    pattern_ast = pattern_visitor.create_pattern_object(
+        pattern, version=stix_version,
+    )
 
-        _pattern_normalizer = ChainTransformer(
-            normalize_comp_expr,
-            obs_settle_simplify, obs_dnf, obs_settle_simplify,
-        )
+    norm_pattern_ast, _ = _PATTERN_NORMALIZER.transform(pattern_ast)
+
+    return observation_expression_key(norm_pattern_ast)
+
+
+@functools.lru_cache(maxsize=1024)
+def _pattern_fingerprint(pattern, stix_version):
+    """
+    Compute the fingerprint of a STIX pattern's comparison key.  Cached the
+    same way as _normalize_pattern(), which it uses.
 
-    return _pattern_normalizer
+    Args:
+        pattern: A STIX pattern as a string
+        stix_version: The STIX version to use for pattern parsing, as a string
+            ("2.0", "2.1", etc).
+
+    Returns:
+        The fingerprint, as bytes.  See _key_fingerprint().
+    """
+    return _key_fingerprint(_normalize_pattern(pattern, stix_version))
 
 
 def equivalent_patterns(pattern1, pattern2, stix_version=DEFAULT_VERSION):
@@ -70,24 +194,96 @@ def equivalent_patterns(pattern1, pattern2, stix_version=DEFAULT_VERSION):
     Returns:
         True if the patterns are semantically equivalent; False if not
     """
-    patt_ast1 = pattern_visitor.create_pattern_object(
-        pattern1, version=stix_version,
-    )
-    patt_ast2 = pattern_visitor.create_pattern_object(
-        pattern2, version=stix_version,
-    )
+    norm_patt1 = _normalize_pattern(pattern1, stix_version)
 
-    pattern_normalizer = _get_pattern_normalizer()
-    norm_patt1, _ = pattern_normalizer.transform(patt_ast1)
-    norm_patt2, _ = pattern_normalizer.transform(patt_ast2)
+    # Identical pattern strings are trivially equivalent.  This is checked
+    # after normalizing one of them, so that invalid patterns still error out.
+    if pattern1 == pattern2:
+        return True
 
-    result = observation_expression_cmp(norm_patt1, norm_patt2)
+    norm_patt2 = _normalize_pattern(pattern2, stix_version)
 
-    return result == 0
+    return norm_patt1 == norm_patt2
+
+
+def pattern_fingerprint(pattern, stix_version=DEFAULT_VERSION):
+    """
+    Compute a fingerprint of a STIX pattern's normalized form.  Semantically
+    equivalent patterns always have the same fingerprint, so fingerprints can
+    be used as dict keys or set members to bucket large numbers of patterns
+    in linear time, instead of comparing every pair.
+
+    Fingerprints are 128-bit hashes.  Different fingerprints mean patterns
+    are definitely not equivalent, but a hash collision could give
+    non-equivalent patterns the same fingerprint.  This is extremely unlikely;
+    if exact results are required, confirm matches with
+    equivalent_patterns().
+
+    Args:
+        pattern: A STIX pattern as a string
+        stix_version: The STIX version to use for pattern parsing, as a string
+            ("2.0", "2.1", etc).  Defaults to library-wide default version.
+
+    Returns:
+        The fingerprint, as bytes
+    """
+    return _pattern_fingerprint(pattern, stix_version)
+
+
+def _match_one(pattern, search_pattern, norm_search_pattern, stix_version):
+    """
+    Determine whether a pattern is equivalent to an already-normalized search
+    pattern.
+
+    Args:
+        pattern: A STIX pattern as a string
+        search_pattern: The search pattern as a string
+        norm_search_pattern: The normalized search pattern, as returned from
+            _normalize_pattern()
+        stix_version: The STIX version to use for pattern parsing, as a string
+            ("2.0", "2.1", etc).
+
+    Returns:
+        True if the pattern is equivalent to the search pattern; False if not
+    """
+    # Identical strings match without any parsing; the search pattern has
+    # already been validated by normalizing it.
+    if pattern == search_pattern:
+        result = True
+
+    else:
+        norm_pattern = _normalize_pattern(pattern, stix_version)
+        result = norm_search_pattern == norm_pattern
+
+    return result
+
+
+def _init_match_worker(search_pattern, stix_version):
+    """
+    Worker process initializer for find_equivalent_patterns().  Normalizes
+    the search pattern once per worker, so it needn't be sent with each task.
+    """
+    global _worker_search_pattern, _worker_norm_search_pattern
+
+    _worker_search_pattern = search_pattern
+    _worker_norm_search_pattern = _normalize_pattern(
+        search_pattern, stix_version,
+    )
+
+
+def _worker_match_one(pattern, stix_version):
+    """
+    Worker process task for find_equivalent_patterns().  Matches against the
+    search pattern set up by _init_match_worker().
+    """
+    return _match_one(
+        pattern, _worker_search_pattern, _worker_norm_search_pattern,
+        stix_version,
+    )
 
 
 def find_equivalent_patterns(
-    search_pattern, patterns, stix_version=DEFAULT_VERSION,
+    search_pattern, patterns, stix_version=DEFAULT_VERSION, workers=None,
 ):
     """
     Find patterns from a sequence which are equivalent to a given pattern.
@@ -96,33 +292,110 @@ def find_equivalent_patterns(
     on an input iterable and is implemented as a generator of matches.  So you
     can "stream" patterns in and matching patterns will be streamed out.
 
+    If workers is given, patterns are normalized and compared in a pool of
+    that many processes.  The input iterable is consumed in bounded batches,
+    with the next batch queued while results from the current one are
+    produced, and matches are still produced in input order.  If iteration
+    stops early, the batches already queued are still completed before the
+    pool shuts down.
+
     Args:
         search_pattern: A search pattern as a string
         patterns: An iterable over patterns as strings
         stix_version: The STIX version to use for pattern parsing, as a string
             ("2.0", "2.1", etc).  Defaults to library-wide default version.
+        workers: The number of worker processes to use, or None to do all
+            work in the calling process.  Defaults to None.
 
     Returns:
         A generator iterator producing the semantically equivalent patterns
+
+    Raises:
+        ValueError: If workers is less than 1
     """
-    search_pattern_ast = pattern_visitor.create_pattern_object(
-        search_pattern, version=stix_version,
-    )
+    if workers is not None and workers < 1:
+        raise ValueError("'workers' must be greater than 0")
 
-    pattern_normalizer = _get_pattern_normalizer()
-    norm_search_pattern_ast, _ = pattern_normalizer.transform(
-        search_pattern_ast,
-    )
+    # Normalize in the calling process in all cases, so that an invalid
+    # search pattern raises the same error regardless of workers.
+    norm_search_pattern = _normalize_pattern(search_pattern, stix_version)
 
-    for pattern in patterns:
-        pattern_ast = pattern_visitor.create_pattern_object(
-            pattern, version=stix_version,
-        )
-        norm_pattern_ast, _ = pattern_normalizer.transform(pattern_ast)
+    if workers is None:
+        for pattern in patterns:
+            if _match_one(
+                pattern, search_pattern, norm_search_pattern, stix_version,
+            ):
+                yield pattern
 
-        result = observation_expression_cmp(
-            norm_search_pattern_ast, norm_pattern_ast,
-        )
+    else:
+        patterns = iter(patterns)
+        batch_size = _MATCH_CHUNKSIZE * _MATCH_BATCH_CHUNKS * workers
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_match_worker,
+            initargs=(search_pattern, stix_version),
+        ) as executor:
+            match_one = functools.partial(
+                _worker_match_one, stix_version=stix_version,
+            )
+
+            batch = list(itertools.islice(patterns, batch_size))
+            results = executor.map(
+                match_one, batch, chunksize=_MATCH_CHUNKSIZE,
+            )
+
+            while batch:
+                # Queue the next batch before consuming this one, so workers
+                # don't sit idle at batch boundaries.
+                next_batch = list(itertools.islice(patterns, batch_size))
+                next_results = executor.map(
+                    match_one, next_batch, chunksize=_MATCH_CHUNKSIZE,
+                )
+
+                for pattern, result in zip(batch, results):
+                    if result:
+                        yield pattern
 
-        if result == 0:
-            yield pattern
+                batch, results = next_batch, next_results
+
+
+def find_equivalent_patterns_many(
+    search_patterns, patterns, stix_version=DEFAULT_VERSION,
+):
+    """
+    Find patterns from a sequence which are equivalent to any of several
+    search patterns.  This is more efficient than calling
+    find_equivalent_patterns() once per search pattern, because every pattern
+    is normalized only once, and candidates are matched to search patterns
+    via fingerprint lookups rather than by comparing against each search
+    pattern in turn.  Like find_equivalent_patterns(), this is implemented as
+    a generator, so patterns may be streamed in.  The search patterns are
+    consumed up front.
+
+    Args:
+        search_patterns: An iterable over search patterns as strings
+        patterns: An iterable over patterns as strings
+        stix_version: The STIX version to use for pattern parsing, as a string
+            ("2.0", "2.1", etc).  Defaults to library-wide default version.
+
+    Returns:
+        A generator iterator producing (search pattern, pattern) 2-tuples for
+        each pattern and each search pattern it is semantically equivalent
+        to.  Pairs are produced in pattern order, then search pattern order.
+    """
+    search_buckets = {}
+    for search_pattern in search_patterns:
+        search_buckets.setdefault(
+            _pattern_fingerprint(search_pattern, stix_version), [],
+        ).append(search_pattern)
+
+    for pattern in patterns:
+        for search_pattern in search_buckets.get(
+            _pattern_fingerprint(pattern, stix_version), (),
+        ):
+            # Confirm, in case of a fingerprint collision.  Keys come from
+            # the normalization cache.
+            if _normalize_pattern(search_pattern, stix_version) \
+                    == _normalize_pattern(pattern, stix_version):
+                yield search_pattern, pattern
@@ -10,6 +10,11 @@ Some generic comparison utility functions.
 |
 """
 
+import itertools
+
+# Fill value marking the end of the shorter sequence in iter_lex_cmp()
+_EXHAUSTED = object()
+
 
 def generic_cmp(value1, value2):
     """
@@ -44,43 +49,28 @@ def iter_lex_cmp(seq1, seq2, cmp):
         <0 if seq1 < seq2; >0 if seq1 > seq2; 0 if they're equal
     """
 
-    it1 = iter(seq1)
-    it2 = iter(seq2)
-
-    it1_exhausted = it2_exhausted = False
-    while True:
-        try:
-            val1 = next(it1)
-        except StopIteration:
-            it1_exhausted = True
-
-        try:
-            val2 = next(it2)
-        except StopIteration:
-            it2_exhausted = True
-
-        # same length, all elements equal
-        if it1_exhausted and it2_exhausted:
-            result = 0
-            break
-
+    result = 0
+    for val1, val2 in itertools.zip_longest(
+        seq1, seq2, fillvalue=_EXHAUSTED,
+    ):
         # one is a prefix of the other; the shorter one is less
-        elif it1_exhausted:
+        if val1 is _EXHAUSTED:
             result = -1
             break
 
-        elif it2_exhausted:
+        elif val2 is _EXHAUSTED:
             result = 1
             break
 
         # neither is exhausted; check values
         else:
-            val_cmp = cmp(val1, val2)
+            result = cmp(val1, val2)
 
-            if val_cmp != 0:
-                result = val_cmp
+            if result != 0:
                 break
 
+    # if the loop completes, both have the same length and all elements
+    # are equal.
     return result
 
 
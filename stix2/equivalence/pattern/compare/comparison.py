@@ -3,6 +3,7 @@ Comparison utilities for STIX pattern comparison expressions.
 """
 import base64
 import functools
+import sys
 
 from stix2.equivalence.pattern.compare import generic_cmp, iter_lex_cmp
 from stix2.patterns import (
@@ -27,6 +28,18 @@ _CONSTANT_TYPE_ORDER = (
 )
 
 
+# Map operators/types to their positions in the above orderings, so
+# comparators can look them up in constant time.
+_COMPARISON_OP_INDEX = {
+    op: idx for idx, op in enumerate(_COMPARISON_OP_ORDER)
+}
+
+
+_CONSTANT_TYPE_INDEX = {
+    type_: idx for idx, type_ in enumerate(_CONSTANT_TYPE_ORDER)
+}
+
+
 def generic_constant_cmp(const1, const2):
     """
     Generic comparator for most _Constant instances.  They must have a "value"
@@ -256,8 +269,8 @@ def comparison_operator_cmp(op1, op2):
         <0, 0, or >0 depending on whether the first arg is less, equal or
         greater than the second
     """
-    op1_idx = _COMPARISON_OP_ORDER.index(op1)
-    op2_idx = _COMPARISON_OP_ORDER.index(op2)
+    op1_idx = _COMPARISON_OP_INDEX[op1]
+    op2_idx = _COMPARISON_OP_INDEX[op2]
 
     result = generic_cmp(op1_idx, op2_idx)
 
@@ -294,8 +307,8 @@ def constant_cmp(value1, value2):
         type1 = type(value1)
         type2 = type(value2)
 
-        type1_idx = _CONSTANT_TYPE_ORDER.index(type1)
-        type2_idx = _CONSTANT_TYPE_ORDER.index(type2)
+        type1_idx = _CONSTANT_TYPE_INDEX[type1]
+        type2_idx = _CONSTANT_TYPE_INDEX[type2]
 
         result = generic_cmp(type1_idx, type2_idx)
         if result == 0:
@@ -385,3 +398,112 @@ def comparison_expression_cmp(expr1, expr2):
         )
 
     return result
+
+
+def _number_key_value(value):
+    """
+    Lower a number for use in a comparison key.  Integral floats become ints,
+    so that numbers which compare equal also have identical key values.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+
+    return value
+
+
+def _list_key_value(value):
+    """
+    Lower a list constant's elements for use in a comparison key.  Like
+    list_cmp(), this is order-insensitive.
+    """
+    return tuple(sorted(constant_key(elt) for elt in value.value))
+
+
+_CONSTANT_KEY_VALUES = {
+    StringConstant: lambda const: sys.intern(const.value),
+    BooleanConstant: lambda const: bool(const.value),
+    TimestampConstant: lambda const: const.value,
+    HexConstant: lambda const: bytes.fromhex(const.value),
+    BinaryConstant: lambda const: base64.standard_b64decode(const.value),
+    ListConstant: _list_key_value,
+}
+
+
+def constant_key(value):
+    """
+    Lower a constant to a comparison key: a value built from tuples and
+    primitives, which compares equal to another constant's key if and only
+    if constant_cmp() finds the constants equal.
+
+    Args:
+        value: A _Constant instance
+
+    Returns:
+        The comparison key
+    """
+    if isinstance(value, (IntegerConstant, FloatConstant)):
+        result = (-1, _number_key_value(value.value))
+
+    else:
+        type_ = type(value)
+        key_value = _CONSTANT_KEY_VALUES.get(type_)
+        if not key_value:
+            raise TypeError("Don't know how to compare " + type_.__name__)
+
+        result = (_CONSTANT_TYPE_INDEX[type_], key_value(value))
+
+    return result
+
+
+def object_path_key(path):
+    """
+    Lower an object path to a comparison key.  See constant_key().
+
+    Args:
+        path: An ObjectPath instance
+
+    Returns:
+        The comparison key
+    """
+    return (
+        sys.intern(path.object_type_name),
+        tuple(
+            sys.intern(comp) if isinstance(comp, str) else comp
+            for comp in object_path_to_raw_values(path)
+        ),
+    )
+
+
+def comparison_expression_key(expr):
+    """
+    Lower a comparison expression AST to a comparison key.  The key compares
+    equal to another expression's key if and only if
+    comparison_expression_cmp() finds the expressions equal.  Like that
+    function, this is sensitive to the order of sub-expressions.
+
+    Args:
+        expr: A comparison expression
+
+    Returns:
+        The comparison key
+    """
+    if isinstance(expr, _ComparisonExpression):
+        result = (
+            0,
+            object_path_key(expr.lhs),
+            _COMPARISON_OP_INDEX[expr.operator],
+            bool(expr.negated),
+            constant_key(expr.rhs),
+        )
+
+    elif isinstance(expr, AndBooleanExpression):
+        result = (
+            1, tuple(comparison_expression_key(op) for op in expr.operands),
+        )
+
+    else:  # OrBooleanExpression
+        result = (
+            2, tuple(comparison_expression_key(op) for op in expr.operands),
+        )
+
+    return result
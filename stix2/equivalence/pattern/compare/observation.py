@@ -3,7 +3,7 @@ Comparison utilities for STIX pattern observation expressions.
 """
 from stix2.equivalence.pattern.compare import generic_cmp, iter_lex_cmp
 from stix2.equivalence.pattern.compare.comparison import (
-    comparison_expression_cmp, generic_constant_cmp,
+    comparison_expression_cmp, comparison_expression_key, generic_constant_cmp,
 )
 from stix2.patterns import (
     AndObservationExpression, FollowedByObservationExpression,
@@ -23,6 +23,18 @@ _QUALIFIER_TYPE_ORDER = (
 )
 
 
+# Map types to their positions in the above orderings, so comparators can
+# look them up in constant time.
+_OBSERVATION_EXPRESSION_TYPE_INDEX = {
+    type_: idx for idx, type_ in enumerate(_OBSERVATION_EXPRESSION_TYPE_ORDER)
+}
+
+
+_QUALIFIER_TYPE_INDEX = {
+    type_: idx for idx, type_ in enumerate(_QUALIFIER_TYPE_ORDER)
+}
+
+
 def repeats_cmp(qual1, qual2):
     """
     Compare REPEATS qualifiers.  This orders by repeat count.
@@ -75,8 +87,8 @@ def observation_expression_cmp(expr1, expr2):
     type1 = type(expr1)
     type2 = type(expr2)
 
-    type1_idx = _OBSERVATION_EXPRESSION_TYPE_ORDER.index(type1)
-    type2_idx = _OBSERVATION_EXPRESSION_TYPE_ORDER.index(type2)
+    type1_idx = _OBSERVATION_EXPRESSION_TYPE_INDEX[type1]
+    type2_idx = _OBSERVATION_EXPRESSION_TYPE_INDEX[type2]
 
     if type1_idx != type2_idx:
         result = generic_cmp(type1_idx, type2_idx)
@@ -102,8 +114,8 @@ def observation_expression_cmp(expr1, expr2):
         qual1_type = type(expr1.qualifier)
         qual2_type = type(expr2.qualifier)
 
-        qual1_type_idx = _QUALIFIER_TYPE_ORDER.index(qual1_type)
-        qual2_type_idx = _QUALIFIER_TYPE_ORDER.index(qual2_type)
+        qual1_type_idx = _QUALIFIER_TYPE_INDEX[qual1_type]
+        qual2_type_idx = _QUALIFIER_TYPE_INDEX[qual2_type]
 
         result = generic_cmp(qual1_type_idx, qual2_type_idx)
 
@@ -124,3 +136,59 @@ def observation_expression_cmp(expr1, expr2):
             )
 
     return result
+
+
+_QUALIFIER_KEY_VALUES = {
+    RepeatQualifier: lambda qual: qual.times_to_repeat.value,
+    WithinQualifier: lambda qual: qual.number_of_seconds.value,
+    StartStopQualifier: lambda qual: (
+        qual.start_time.value, qual.stop_time.value,
+    ),
+}
+
+
+def observation_expression_key(expr):
+    """
+    Lower an observation expression AST to a comparison key: nested tuples of
+    primitive values, which compare equal to another expression's key if and
+    only if observation_expression_cmp() finds the expressions equal.  Like
+    that function, this is sensitive to the order of the expressions'
+    sub-components.
+
+    Keys are immutable and hashable, much more compact than the AST, and
+    comparing two of them does not need any Python-level recursion.
+
+    Args:
+        expr: An observation expression
+
+    Returns:
+        The comparison key
+    """
+    type_ = type(expr)
+    type_idx = _OBSERVATION_EXPRESSION_TYPE_INDEX[type_]
+
+    if type_ is ObservationExpression:
+        result = (type_idx, comparison_expression_key(expr.operand))
+
+    elif isinstance(expr, _CompoundObservationExpression):
+        result = (
+            type_idx,
+            tuple(observation_expression_key(op) for op in expr.operands),
+        )
+
+    else:  # QualifiedObservationExpression
+        qual_type = type(expr.qualifier)
+        key_value = _QUALIFIER_KEY_VALUES.get(qual_type)
+        if not key_value:
+            raise TypeError(
+                "Can't compare qualifier type: " + qual_type.__name__,
+            )
+
+        result = (
+            type_idx,
+            _QUALIFIER_TYPE_INDEX[qual_type],
+            key_value(expr.qualifier),
+            observation_expression_key(expr.observation_expression),
+        )
+
+    return result
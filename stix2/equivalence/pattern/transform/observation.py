@@ -119,7 +119,7 @@ class ObservationExpressionTransformer(Transformer):
         if isinstance(ast, ObservationExpression):
             # A "leaf node" for observation expressions.  We don't recurse into
             # these.
-            result, this_changed = self.__dispatch_transform(ast)
+            result, this_changed = self._dispatch_transform(ast)
             if this_changed:
                 changed = True
 
@@ -130,7 +130,7 @@ class ObservationExpressionTransformer(Transformer):
                     ast.operands[i] = result
                     changed = True
 
-            result, this_changed = self.__dispatch_transform(ast)
+            result, this_changed = self._dispatch_transform(ast)
             if this_changed:
                 changed = True
 
@@ -142,7 +142,7 @@ class ObservationExpressionTransformer(Transformer):
                 ast.observation_expression = result
                 changed = True
 
-            result, this_changed = self.__dispatch_transform(ast)
+            result, this_changed = self._dispatch_transform(ast)
             if this_changed:
                 changed = True
 
@@ -160,7 +160,7 @@ class ObservationExpressionTransformer(Transformer):
 
         return result, changed
 
-    def __dispatch_transform(self, ast):
+    def _dispatch_transform(self, ast):
         """
         Invoke a transformer callback method based on the given ast root node
         type.
@@ -429,6 +429,35 @@ class AbsorptionTransformer(
         return ast, changed
 
 
+class FusedSimplifyTransformer(ObservationExpressionTransformer):
+    """
+    Flatten, order/dedupe, and apply absorption to an observation expression
+    AST, all in a single bottom-up pass.  At each node, the node-level steps
+    of FlattenTransformer, OrderDedupeTransformer and AbsorptionTransformer
+    are applied in that order.  Settling this transformer reaches the same
+    result as settling a chain of those three, with one traversal of the AST
+    per round instead of three.
+    """
+
+    def __init__(self):
+        self.__transformers = (
+            FlattenTransformer(),
+            OrderDedupeTransformer(),
+            AbsorptionTransformer(),
+        )
+
+    def transform_default(self, ast):
+        changed = False
+        for transformer in self.__transformers:
+            # Dispatch on each step's result, since flattening can replace a
+            # node with its child, of a different type.
+            ast, this_changed = transformer._dispatch_transform(ast)
+            if this_changed:
+                changed = True
+
+        return ast, changed
+
+
 class DNFTransformer(ObservationExpressionTransformer):
     """
     Transform an observation expression to DNF.  This will distribute AND and
@@ -19,7 +19,30 @@ Note:
 |
 """
 
-from stix2.markings import granular_markings, object_markings
+from stix2.markings import granular_markings, object_markings, utils
+
+# Above this many items, _small_dedup() switches to hash-based deduplication.
+_SMALL_DEDUP_MAX = 8
+
+
+def _small_dedup(seq):
+    """
+    Remove duplicates from a list, preserving order. Marking lists are
+    usually tiny, and a linear scan is cheaper than hashing for those; longer
+    lists are deduplicated via a dict.
+    """
+    if len(seq) <= 1:
+        return seq
+
+    if len(seq) > _SMALL_DEDUP_MAX:
+        return list(dict.fromkeys(seq))
+
+    deduped = []
+    for item in seq:
+        if item not in deduped:
+            deduped.append(item)
+
+    return deduped
 
 
 def get_markings(obj, selectors=None, inherited=False, descendants=False, marking_ref=True, lang=True):
@@ -58,10 +81,13 @@ def get_markings(obj, selectors=None, inherited=False, descendants=False, markin
         lang,
     )
 
+    # Granular markings are already unique; only inherited object markings
+    # can introduce duplicates.
     if inherited:
         results.extend(object_markings.get_markings(obj))
+        results = _small_dedup(results)
 
-    return list(set(results))
+    return results
 
 
 def set_markings(obj, marking, selectors=None, marking_ref=True, lang=True):
@@ -101,8 +127,8 @@ def remove_markings(obj, marking, selectors=None):
 
     Args:
         obj: An SDO or SRO object.
-        marking: identifier or list of marking identifiers that apply to the
-            properties selected by `selectors`.
+        marking: identifier, or list or set of marking identifiers that apply
+            to the properties selected by `selectors`.
         selectors: string or list of selectors strings relative to the SDO or
             SRO in which the properties appear.
 
@@ -191,8 +217,8 @@ def is_marked(obj, marking=None, selectors=None, inherited=False, descendants=Fa
 
     Args:
         obj: An SDO or SRO object.
-        marking: identifier or list of marking identifiers that apply to the
-            properties selected by `selectors`.
+        marking: identifier, or list or set of marking identifiers that apply
+            to the properties selected by `selectors`.
         selectors: string or list of selectors strings relative to the SDO or
             SRO in which the field(s) appear(s).
         inherited (bool): If True, include object level markings and granular
@@ -206,50 +232,57 @@ def is_marked(obj, marking=None, selectors=None, inherited=False, descendants=Fa
             False otherwise.
 
     Note:
-        When a list of marking identifiers is provided, if ANY of the provided
-        marking identifiers match, True is returned.
+        When a list of marking identifiers is provided, True is returned only
+        if ALL of the provided marking identifiers are found. With
+        ``inherited``, they may be found among the granular and object level
+        markings combined.
 
         If ``selectors`` is None, operation will be performed only on object
-        level markings.
+        level markings, and True is returned if ANY of the provided marking
+        identifiers match.
 
     """
+    marking = utils.convert_to_marking_set(marking)
+
     if selectors is None:
         return object_markings.is_marked(obj, marking)
 
-    result = granular_markings.is_marked(
-        obj,
-        marking,
-        selectors,
-        inherited,
-        descendants,
-    )
-
     if inherited:
-        granular_marks = granular_markings.get_markings(obj, selectors)
-        object_marks = object_markings.get_markings(obj)
-
-        if granular_marks:
-            result = granular_markings.is_marked(
-                obj,
-                granular_marks,
-                selectors,
-                inherited,
-                descendants,
-            )
+        # One granular pass both enumerates and tests the markings.
+        granular_marks = granular_markings.get_markings(
+            obj,
+            selectors,
+            inherited,
+            descendants,
+        )
+        object_marks = utils.convert_to_list(
+            object_markings.get_markings(obj),
+        )
+
+        if marking:
+            # Object level markings are inherited, so all user-provided
+            # markings must be found among the two levels combined.
+            result = marking.issubset(set(granular_marks).union(object_marks))
+        else:
+            result = bool(granular_marks or object_marks)
 
-        result = result or object_markings.is_marked(obj, object_marks)
+    else:
+        result = granular_markings.is_marked(
+            obj,
+            marking,
+            selectors,
+            inherited,
+            descendants,
+        )
 
     return result
 
 
 class _MarkingsMixin(object):
-    pass
-
-
-# Note that all of these methods will return a new object because of immutability
-_MarkingsMixin.get_markings = get_markings
-_MarkingsMixin.set_markings = set_markings
-_MarkingsMixin.remove_markings = remove_markings
-_MarkingsMixin.add_markings = add_markings
-_MarkingsMixin.clear_markings = clear_markings
-_MarkingsMixin.is_marked = is_marked
+    # Note that all of these methods will return a new object because of immutability
+    get_markings = get_markings
+    set_markings = set_markings
+    remove_markings = remove_markings
+    add_markings = add_markings
+    clear_markings = clear_markings
+    is_marked = is_marked
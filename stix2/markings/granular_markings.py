@@ -26,7 +26,8 @@ def get_markings(obj, selectors, inherited=False, descendants=False, marking_ref
         InvalidSelectorError: If `selectors` fail validation.
 
     Returns:
-        list: Marking identifiers that matched the selectors expression.
+        list: Marking identifiers that matched the selectors expression. Each
+            identifier appears at most once.
 
     """
     selectors = utils.convert_to_list(selectors)
@@ -91,8 +92,8 @@ def remove_markings(obj, marking, selectors):
 
     Args:
         obj: An SDO or SRO object.
-        marking: identifier or list of marking identifiers that apply to the
-            properties selected by `selectors`.
+        marking: identifier, or list or set of marking identifiers that apply
+            to the properties selected by `selectors`.
         selectors: string or list of selectors strings relative to the SDO or
             SRO in which the properties appear.
 
@@ -251,8 +252,8 @@ def is_marked(obj, marking=None, selectors=None, inherited=False, descendants=Fa
 
     Args:
         obj: An SDO or SRO object.
-        marking: identifier or list of marking identifiers that apply to the
-            properties selected by `selectors`.
+        marking: identifier, or list or set of marking identifiers that apply
+            to the properties selected by `selectors`.
         selectors (bool): string or list of selectors strings relative to the
             SDO or SRO in which the properties appear.
         inherited (bool): If True, return markings inherited from the given
@@ -268,15 +269,15 @@ def is_marked(obj, marking=None, selectors=None, inherited=False, descendants=Fa
             False otherwise.
 
     Note:
-        When a list of marking identifiers is provided, if ANY of the provided
-        marking identifiers match, True is returned.
+        When a list of marking identifiers is provided, True is returned only
+        if ALL of the provided marking identifiers are found.
 
     """
     if selectors is None:
         raise TypeError("Required argument 'selectors' must be provided")
 
     selectors = utils.convert_to_list(selectors)
-    marking = utils.convert_to_marking_list(marking)
+    marking = utils.convert_to_marking_set(marking)
     utils.validate(obj, selectors)
 
     granular_markings = obj.get('granular_markings', [])
@@ -296,15 +297,15 @@ def is_marked(obj, marking=None, selectors=None, inherited=False, descendants=Fa
                     marking_ref = granular_marking.get('marking_ref', '')
                     lang = granular_marking.get('lang', '')
 
-                    if marking and any(x == marking_ref for x in marking):
-                        markings.update([marking_ref])
-                    if marking and any(x == lang for x in marking):
-                        markings.update([lang])
+                    if marking and marking_ref in marking:
+                        markings.add(marking_ref)
+                    if marking and lang in marking:
+                        markings.add(lang)
 
                     marked = True
 
     if marking:
         # All user-provided markings must be found.
-        return markings.issuperset(set(marking))
+        return markings.issuperset(marking)
 
     return marked
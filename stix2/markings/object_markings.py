@@ -1,10 +1,20 @@
 """Functions for working with STIX2 object markings."""
 
 from stix2 import exceptions
+import stix2.base
 from stix2.markings import utils
 from stix2.versioning import new_version
 
 
+def _object_marking_refs(obj):
+    # Read STIX objects' backing dict directly, skipping the Mapping.get()
+    # and __getitem__ layers; other mappings are used as-is.
+    if isinstance(obj, stix2.base._STIXBase):
+        obj = obj._inner
+
+    return obj.get('object_marking_refs', [])
+
+
 def get_markings(obj):
     """
     Get all object level markings from the given SDO or SRO object.
@@ -17,7 +27,7 @@ def get_markings(obj):
             markings are present in `object_marking_refs`.
 
     """
-    return obj.get('object_marking_refs', [])
+    return _object_marking_refs(obj)
 
 
 def add_markings(obj, marking):
@@ -34,7 +44,7 @@ def add_markings(obj, marking):
     """
     marking = utils.convert_to_marking_list(marking)
 
-    object_markings = set(obj.get('object_marking_refs', []) + marking)
+    object_markings = set(_object_marking_refs(obj) + marking)
 
     return new_version(obj, object_marking_refs=list(object_markings), allow_custom=True)
 
@@ -45,7 +55,7 @@ def remove_markings(obj, marking):
 
     Args:
         obj: A SDO or SRO object.
-        marking: identifier or list of identifiers that apply to the
+        marking: identifier, or list or set of identifiers that apply to the
             SDO or SRO object.
 
     Raises:
@@ -58,12 +68,12 @@ def remove_markings(obj, marking):
     """
     marking = utils.convert_to_marking_list(marking)
 
-    object_markings = obj.get('object_marking_refs', [])
+    object_markings = _object_marking_refs(obj)
 
     if not object_markings:
         return obj
 
-    if any(x not in obj['object_marking_refs'] for x in marking):
+    if any(x not in object_markings for x in marking):
         raise exceptions.MarkingNotFoundError(obj, marking)
 
     new_markings = [x for x in object_markings if x not in marking]
@@ -111,8 +121,8 @@ def is_marked(obj, marking=None):
 
     Args:
         obj: A SDO or SRO object.
-        marking: identifier or list of marking identifiers that apply to the
-            SDO or SRO object.
+        marking: identifier, or list or set of marking identifiers that apply
+            to the SDO or SRO object.
 
     Returns:
         bool: True if SDO or SRO has object level markings. False otherwise.
@@ -123,7 +133,7 @@ def is_marked(obj, marking=None):
 
     """
     marking = utils.convert_to_marking_list(marking)
-    object_markings = obj.get('object_marking_refs', [])
+    object_markings = _object_marking_refs(obj)
 
     if marking:
         return any(x in object_markings for x in marking)
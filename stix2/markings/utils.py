@@ -5,37 +5,6 @@ import collections
 from stix2 import exceptions, utils
 
 
-def _evaluate_expression(obj, selector):
-    """Walk an SDO or SRO generating selectors to match against ``selector``.
-
-    If a match is found and the the value of this property is present in the
-    objects. Matching value of the property will be returned.
-
-    Args:
-        obj: An SDO or SRO object.
-        selector (str): A string following the selector syntax.
-
-    Returns:
-        list: Values contained in matching property. Otherwise empty list.
-
-    """
-    for items, value in iterpath(obj):
-        path = '.'.join(items)
-
-        if path == selector and value:
-            return [value]
-
-    return []
-
-
-def _validate_selector(obj, selector):
-    """Evaluate each selector against an object."""
-    results = list(_evaluate_expression(obj, selector))
-
-    if len(results) >= 1:
-        return True
-
-
 def _get_marking_id(marking):
     if type(marking).__name__ == 'MarkingDefinition':  # avoid circular import
         return marking.id
@@ -43,10 +12,23 @@ def _get_marking_id(marking):
 
 
 def validate(obj, selectors):
-    """Given an SDO or SRO, check that each selector is valid."""
+    """Given an SDO or SRO, check that each selector is valid.
+
+    A selector is valid if it matches the path of a property present in the
+    object. All selectors are checked in a single walk of the object.
+    """
     if selectors:
+        unmatched = set(s for s in selectors if isinstance(s, str))
+
+        for items, value in iterpath(obj):
+            if not unmatched:
+                break
+
+            if value:
+                unmatched.discard('.'.join(items))
+
         for s in selectors:
-            if not _validate_selector(obj, s):
+            if not isinstance(s, str) or s in unmatched:
                 raise exceptions.InvalidSelectorError(obj, s)
         return
 
@@ -65,12 +47,19 @@ def convert_to_list(data):
 def convert_to_marking_list(data):
     """Convert input into a list of marking identifiers."""
     if data is not None:
-        if isinstance(data, list):
+        if isinstance(data, (list, tuple, set, frozenset)):
             return [_get_marking_id(x) for x in data]
         else:
             return [_get_marking_id(data)]
 
 
+def convert_to_marking_set(data):
+    """Convert input into a frozenset of marking identifiers, for fast
+    membership tests."""
+    if data is not None:
+        return frozenset(convert_to_marking_list(data))
+
+
 def compress_markings(granular_markings):
     """Compress granular markings list.
 
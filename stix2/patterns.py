@@ -21,7 +21,7 @@ def quote_if_needed(x):
 
 
 class _Constant(object):
-    pass
+    __slots__ = ('value',)
 
 
 class StringConstant(_Constant):
@@ -31,6 +31,8 @@ class StringConstant(_Constant):
         value (str): string value
     """
 
+    __slots__ = ('needs_to_be_quoted',)
+
     def __init__(self, value, from_parse_tree=False):
         self.needs_to_be_quoted = not from_parse_tree
         self.value = value
@@ -45,6 +47,9 @@ class TimestampConstant(_Constant):
     Args:
         value (datetime.datetime OR str): if string, must be a timestamp string
     """
+
+    __slots__ = ()
+
     def __init__(self, value):
         try:
             self.value = parse_into_datetime(value)
@@ -61,6 +66,9 @@ class IntegerConstant(_Constant):
     Args:
         value (int): integer value
     """
+
+    __slots__ = ()
+
     def __init__(self, value):
         try:
             self.value = int(value)
@@ -72,6 +80,8 @@ class IntegerConstant(_Constant):
 
 
 class FloatConstant(_Constant):
+    __slots__ = ()
+
     def __init__(self, value):
         try:
             self.value = float(value)
@@ -90,6 +100,9 @@ class BooleanConstant(_Constant):
            (str) 'true', 't' for True; 'false', 'f' for False
            (int) 1 for True; 0 for False
     """
+
+    __slots__ = ()
+
     def __init__(self, value):
         if isinstance(value, bool):
             self.value = value
@@ -147,6 +160,9 @@ class HashConstant(StringConstant):
             "SHA384", "SHA512", "SHA3224", "SHA3256", "SHA3384",
             "SHA3512", "SSDEEP", "WHIRLPOOL"
     """
+
+    __slots__ = ()
+
     def __init__(self, value, type):
         key = type.upper().replace('-', '')
         if key in _HASH_REGEX:
@@ -163,6 +179,8 @@ class BinaryConstant(_Constant):
         value (str): base64 encoded string value
     """
 
+    __slots__ = ()
+
     def __init__(self, value, from_parse_tree=False):
         # support with or without a 'b'
         if from_parse_tree:
@@ -185,6 +203,9 @@ class HexConstant(_Constant):
     Args:
         value (str): hexadecimal value
     """
+
+    __slots__ = ()
+
     def __init__(self, value, from_parse_tree=False):
         # support with or without an 'h'
         if not from_parse_tree and re.match('^([a-fA-F0-9]{2})+$', value):
@@ -206,6 +227,9 @@ class ListConstant(_Constant):
     Args:
         value (list): list of values
     """
+
+    __slots__ = ()
+
     def __init__(self, values):
         # handle _Constants or make a _Constant
         self.value = [x if isinstance(x, _Constant) else make_constant(x) for x in values]
@@ -244,6 +268,8 @@ def make_constant(value):
 
 
 class _ObjectPathComponent(object):
+    __slots__ = ('property_name',)
+
     @staticmethod
     def create_ObjectPathComponent(component_name):
         # first case is to handle if component_name was quoted
@@ -272,6 +298,9 @@ class BasicObjectPathComponent(_ObjectPathComponent):
         property_name (str): object property name
         is_key (bool): is dictionary key, default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, property_name, is_key):
         self.property_name = property_name
         # TODO: set is_key to True if this component is a dictionary key
@@ -285,6 +314,9 @@ class ListObjectPathComponent(_ObjectPathComponent):
         property_name (str): list object property name
         index (int): index of the list property's value that is specified
     """
+
+    __slots__ = ('index',)
+
     def __init__(self, property_name, index):
         self.property_name = property_name
         self.index = index
@@ -299,6 +331,9 @@ class ReferenceObjectPathComponent(_ObjectPathComponent):
     Args:
         reference_property_name (str): reference object property name
     """
+
+    __slots__ = ()
+
     def __init__(self, reference_property_name):
         self.property_name = reference_property_name
 
@@ -310,6 +345,9 @@ class ObjectPath(object):
         object_type_name (str): name of object type for corresponding object path component
         property_path (_ObjectPathComponent OR str): object path
     """
+
+    __slots__ = ('object_type_name', 'property_path')
+
     def __init__(self, object_type_name, property_path):
         self.object_type_name = object_type_name
         self.property_path = [
@@ -338,7 +376,7 @@ class ObjectPath(object):
 
 
 class _PatternExpression(object):
-    pass
+    __slots__ = ()
 
 
 class _ComparisonExpression(_PatternExpression):
@@ -350,6 +388,9 @@ class _ComparisonExpression(_PatternExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ('operator', 'lhs', 'rhs', 'negated', 'root_types')
+
     def __init__(self, operator, lhs, rhs, negated=False):
         if operator == "=" and isinstance(rhs, (ListConstant, list)):
             self.operator = "IN"
@@ -381,6 +422,9 @@ class EqualityComparisonExpression(_ComparisonExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(EqualityComparisonExpression, self).__init__("=", lhs, rhs, negated)
 
@@ -393,6 +437,9 @@ class GreaterThanComparisonExpression(_ComparisonExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(GreaterThanComparisonExpression, self).__init__(">", lhs, rhs, negated)
 
@@ -405,6 +452,9 @@ class LessThanComparisonExpression(_ComparisonExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(LessThanComparisonExpression, self).__init__("<", lhs, rhs, negated)
 
@@ -417,6 +467,9 @@ class GreaterThanEqualComparisonExpression(_ComparisonExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(GreaterThanEqualComparisonExpression, self).__init__(">=", lhs, rhs, negated)
 
@@ -430,6 +483,8 @@ class LessThanEqualComparisonExpression(_ComparisonExpression):
         negated (bool): comparison expression negated. Default: False
     """
 
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(LessThanEqualComparisonExpression, self).__init__("<=", lhs, rhs, negated)
 
@@ -442,6 +497,9 @@ class InComparisonExpression(_ComparisonExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(InComparisonExpression, self).__init__("IN", lhs, rhs, negated)
 
@@ -455,6 +513,8 @@ class LikeComparisonExpression(_ComparisonExpression):
         negated (bool): comparison expression negated. Default: False
     """
 
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(LikeComparisonExpression, self).__init__("LIKE", lhs, rhs, negated)
 
@@ -467,6 +527,9 @@ class MatchesComparisonExpression(_ComparisonExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(MatchesComparisonExpression, self).__init__("MATCHES", lhs, rhs, negated)
 
@@ -479,6 +542,9 @@ class IsSubsetComparisonExpression(_ComparisonExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(IsSubsetComparisonExpression, self).__init__("ISSUBSET", lhs, rhs, negated)
 
@@ -491,6 +557,9 @@ class IsSupersetComparisonExpression(_ComparisonExpression):
         rhs (ObjectPath OR str): object path of right-hand-side component of expression
         negated (bool): comparison expression negated. Default: False
     """
+
+    __slots__ = ()
+
     def __init__(self, lhs, rhs, negated=False):
         super(IsSupersetComparisonExpression, self).__init__("ISSUPERSET", lhs, rhs, negated)
 
@@ -502,6 +571,9 @@ class _BooleanExpression(_PatternExpression):
         operator (str): boolean operator
         operands (list): boolean operands
     """
+
+    __slots__ = ('operator', 'operands', 'root_types')
+
     def __init__(self, operator, operands):
         self.operator = operator
         self.operands = list(operands)
@@ -530,6 +602,9 @@ class AndBooleanExpression(_BooleanExpression):
     Args:
         operands (list): AND operands
     """
+
+    __slots__ = ()
+
     def __init__(self, operands):
         super(AndBooleanExpression, self).__init__("AND", operands)
 
@@ -540,6 +615,9 @@ class OrBooleanExpression(_BooleanExpression):
     Args:
         operands (list): OR operands
     """
+
+    __slots__ = ()
+
     def __init__(self, operands):
         super(OrBooleanExpression, self).__init__("OR", operands)
 
@@ -550,6 +628,9 @@ class ObservationExpression(_PatternExpression):
     Args:
         operand (str): observation expression operand
     """
+
+    __slots__ = ('operand',)
+
     def __init__(self, operand):
         self.operand = operand
 
@@ -564,6 +645,9 @@ class _CompoundObservationExpression(_PatternExpression):
         operator (str): compound observation operator
         operands (str): compound observation operands
     """
+
+    __slots__ = ('operator', 'operands')
+
     def __init__(self, operator, operands):
         self.operator = operator
         self.operands = operands
@@ -581,6 +665,9 @@ class AndObservationExpression(_CompoundObservationExpression):
     Args:
         operands (str): compound observation operands
     """
+
+    __slots__ = ()
+
     def __init__(self, operands):
         super(AndObservationExpression, self).__init__("AND", operands)
 
@@ -591,6 +678,9 @@ class OrObservationExpression(_CompoundObservationExpression):
     Args:
         operands (str): compound observation operands
     """
+
+    __slots__ = ()
+
     def __init__(self, operands):
         super(OrObservationExpression, self).__init__("OR", operands)
 
@@ -601,6 +691,9 @@ class FollowedByObservationExpression(_CompoundObservationExpression):
     Args:
         operands (str): compound observation operands
     """
+
+    __slots__ = ()
+
     def __init__(self, operands):
         super(FollowedByObservationExpression, self).__init__("FOLLOWEDBY", operands)
 
@@ -611,6 +704,9 @@ class ParentheticalExpression(_PatternExpression):
     Args:
        exp (str): observation expression
     """
+
+    __slots__ = ('expression', 'root_types')
+
     def __init__(self, exp):
         self.expression = exp
         if hasattr(exp, "root_types"):
@@ -621,7 +717,7 @@ class ParentheticalExpression(_PatternExpression):
 
 
 class _ExpressionQualifier(_PatternExpression):
-    pass
+    __slots__ = ()
 
 
 class RepeatQualifier(_ExpressionQualifier):
@@ -630,6 +726,9 @@ class RepeatQualifier(_ExpressionQualifier):
     Args:
         times_to_repeat (int): times the qualifiers is repeated
     """
+
+    __slots__ = ('times_to_repeat',)
+
     def __init__(self, times_to_repeat):
         if isinstance(times_to_repeat, IntegerConstant):
             self.times_to_repeat = times_to_repeat
@@ -648,6 +747,9 @@ class WithinQualifier(_ExpressionQualifier):
     Args:
         number_of_seconds (int): seconds value for 'within' qualifier
     """
+
+    __slots__ = ('number_of_seconds',)
+
     def __init__(self, number_of_seconds):
         if isinstance(number_of_seconds, IntegerConstant):
             self.number_of_seconds = number_of_seconds
@@ -667,6 +769,9 @@ class StartStopQualifier(_ExpressionQualifier):
         start_time (TimestampConstant OR datetime.date): start timestamp for qualifier
         stop_time (TimestampConstant OR datetime.date): stop timestamp for qualifier
     """
+
+    __slots__ = ('start_time', 'stop_time')
+
     def __init__(self, start_time, stop_time):
         if isinstance(start_time, TimestampConstant):
             self.start_time = start_time
@@ -696,6 +801,9 @@ class QualifiedObservationExpression(_PatternExpression):
         observation_expression (PatternExpression OR _CompoundObservationExpression OR ): pattern expression
         qualifier (_ExpressionQualifier): pattern expression qualifier
     """
+
+    __slots__ = ('observation_expression', 'qualifier')
+
     def __init__(self, observation_expression, qualifier):
         self.observation_expression = observation_expression
         self.qualifier = qualifier
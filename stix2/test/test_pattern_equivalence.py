@@ -1,8 +1,17 @@
+import itertools
+
 import pytest
+from stix2patterns.exceptions import ParseException
 
 from stix2.equivalence.pattern import (
-    equivalent_patterns, find_equivalent_patterns,
+    _get_pattern_normalizer, _key_fingerprint, _normalize_pattern,
+    _pattern_fingerprint, equivalent_patterns, find_equivalent_patterns,
+    find_equivalent_patterns_many, pattern_fingerprint,
+)
+from stix2.equivalence.pattern.compare.observation import (
+    observation_expression_cmp, observation_expression_key,
 )
+import stix2.pattern_visitor
 
 # #                                          # #
 # # Observation expression equivalence tests # #
@@ -649,3 +658,198 @@ def test_find_equivalent_patterns():
         "[a:b=1] OR ([a:b=2] AND [a:b=1])",
         "[(a:b=2 OR a:b=1) AND a:b=1]",
     ]
+
+
+def test_find_equivalent_patterns_many():
+    search_patterns = [
+        "[a:b=1]",
+        "[a:b=2]",
+        "[a:b=1 OR a:b=1]",
+        "[x:y=1]",
+    ]
+    other_patterns = [
+        "[a:b=2]",
+        "[a:b=1]",
+        "[a:b=1] WITHIN 1 SECONDS",
+        "[(a:b=2 OR a:b=1) AND a:b=1]",
+        "[c:d=1]",
+    ]
+
+    result = list(
+        find_equivalent_patterns_many(search_patterns, other_patterns),
+    )
+
+    assert result == [
+        ("[a:b=2]", "[a:b=2]"),
+        ("[a:b=1]", "[a:b=1]"),
+        ("[a:b=1 OR a:b=1]", "[a:b=1]"),
+        ("[a:b=1]", "[(a:b=2 OR a:b=1) AND a:b=1]"),
+        ("[a:b=1 OR a:b=1]", "[(a:b=2 OR a:b=1) AND a:b=1]"),
+    ]
+
+
+def test_pattern_fingerprint():
+    patterns = [
+        "[a:b=1]",
+        "[a:b=2]",
+        "[a:b=1] OR ([a:b=2] AND [a:b=1])",
+        "[(a:b=2 OR a:b=1) AND a:b=1]",
+        "[a:b=2 OR a:b=2]",
+        "[c:d=1]",
+    ]
+
+    buckets = {}
+    for pattern in patterns:
+        buckets.setdefault(pattern_fingerprint(pattern), []).append(pattern)
+
+    assert sorted(buckets.values()) == [
+        [
+            "[a:b=1]",
+            "[a:b=1] OR ([a:b=2] AND [a:b=1])",
+            "[(a:b=2 OR a:b=1) AND a:b=1]",
+        ],
+        ["[a:b=2]", "[a:b=2 OR a:b=2]"],
+        ["[c:d=1]"],
+    ]
+
+
+def test_find_equivalent_patterns_normalization_cache():
+    _normalize_pattern.cache_clear()
+
+    search_pattern = "[a:b=1]"
+    other_patterns = [
+        "[a:b=1]",
+        "[a:b=2]",
+        "[a:b=1]",
+        "[a:b=2]",
+    ]
+
+    result = list(
+        find_equivalent_patterns(search_pattern, other_patterns),
+    )
+
+    assert result == ["[a:b=1]", "[a:b=1]"]
+
+    # Candidates identical to the search pattern are matched without
+    # normalizing them.
+    cache_info = _normalize_pattern.cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.hits == 1
+
+
+def test_equivalence_does_not_fingerprint():
+    _pattern_fingerprint.cache_clear()
+
+    assert equivalent_patterns("[a:b=1]", "[a:b=1 OR a:b=1]")
+    assert list(find_equivalent_patterns("[a:b=1]", ["[a:b=2]"])) == []
+
+    assert _pattern_fingerprint.cache_info().currsize == 0
+
+
+def test_equivalent_patterns_identical_strings():
+    _normalize_pattern.cache_clear()
+
+    assert equivalent_patterns("[a:b=1]", "[a:b=1]")
+
+    cache_info = _normalize_pattern.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 0
+
+    # Invalid patterns are rejected even if identical
+    with pytest.raises(ParseException):
+        equivalent_patterns("[a:b=", "[a:b=")
+
+
+def test_find_equivalent_patterns_workers():
+    search_pattern = "[a:b=1]"
+    other_patterns = [
+        "[a:b=2]",
+        "[a:b=1]",
+        "[a:b=1] WITHIN 1 SECONDS",
+        "[a:b=1] OR ([a:b=2] AND [a:b=1])",
+        "[(a:b=2 OR a:b=1) AND a:b=1]",
+        "[c:d=1]",
+        "[a:b>1]",
+    ]
+
+    result = list(
+        find_equivalent_patterns(search_pattern, other_patterns, workers=2),
+    )
+
+    assert result == [
+        "[a:b=1]",
+        "[a:b=1] OR ([a:b=2] AND [a:b=1])",
+        "[(a:b=2 OR a:b=1) AND a:b=1]",
+    ]
+
+
+def test_find_equivalent_patterns_workers_many_batches():
+    other_patterns = ["[a:b={}]".format(i % 3) for i in range(1000)]
+
+    result = list(
+        find_equivalent_patterns("[a:b=1]", other_patterns, workers=2),
+    )
+
+    assert result == ["[a:b=1]"] * 333
+
+
+@pytest.mark.parametrize(
+    "other_patterns", [
+        [],
+        ["[a:b=1]"],
+    ],
+)
+def test_find_equivalent_patterns_workers_bad_search_pattern(other_patterns):
+    with pytest.raises(ParseException):
+        list(find_equivalent_patterns("[a:b=", other_patterns, workers=2))
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_find_equivalent_patterns_bad_workers(workers):
+    with pytest.raises(ValueError):
+        list(find_equivalent_patterns("[a:b=1]", ["[a:b=1]"], workers=workers))
+
+
+def test_observation_expression_key_and_fingerprint_consistent_with_cmp():
+    patterns = [
+        "[a:b=1]",
+        "[a:b=1.0]",
+        "[a:b=1.5]",
+        "[a:b='1']",
+        "[a:b=true]",
+        "[a:b=false]",
+        "[a:b=h'0a']",
+        "[a:b=h'0A']",
+        "[a:b=b'AA==']",
+        "[a:b IN (1, 2, 'x')]",
+        "[a:b IN ('x', 2, 1.0)]",
+        "[a:b NOT = 1]",
+        "[a:b != 1]",
+        "[a:c[0].d=1]",
+        "[a:c[*].d=1]",
+        "[a:b=t'1982-12-31T02:14:17Z']",
+        "[a:b=t'1982-12-31T02:14:17.000Z']",
+        "[a:b=1 AND a:c=2]",
+        "[a:b=1 OR a:c=2]",
+        "[a:b=1] REPEATS 2 TIMES",
+        "[a:b=1] WITHIN 2 SECONDS",
+        "[a:b=1] AND [a:c=2]",
+        "[a:b=1] OR [a:c=2]",
+        "[a:b=1] FOLLOWEDBY [a:c=2]",
+    ]
+
+    pattern_normalizer = _get_pattern_normalizer()
+    norm_asts = [
+        pattern_normalizer.transform(
+            stix2.pattern_visitor.create_pattern_object(pattern),
+        )[0]
+        for pattern in patterns
+    ]
+
+    for ast1, ast2 in itertools.product(norm_asts, repeat=2):
+        cmp_equal = observation_expression_cmp(ast1, ast2) == 0
+        key1 = observation_expression_key(ast1)
+        key2 = observation_expression_key(ast2)
+
+        assert cmp_equal == (key1 == key2)
+        assert cmp_equal == (_key_fingerprint(key1) == _key_fingerprint(key2))
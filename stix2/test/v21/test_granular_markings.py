@@ -310,6 +310,40 @@ def test_get_markings_multiple_selectors(data):
     assert set(xy_markings).union(xz_markings).issuperset(total)
 
 
+def test_get_markings_inherited_no_duplicates():
+    """Test inherited object markings do not duplicate granular markings."""
+    data = {
+        "a": 333,
+        "object_marking_refs": ["1", "2"],
+        "granular_markings": [
+            {
+                "marking_ref": "1",
+                "selectors": ["a"],
+            },
+        ],
+    }
+
+    assert markings.get_markings(data, "a", inherited=True) == ["1", "2"]
+
+
+def test_get_markings_inherited_many_no_duplicates():
+    """Test deduplication of long inherited marking lists."""
+    object_markings = [str(i) for i in range(10)]
+    data = {
+        "a": 333,
+        "object_marking_refs": object_markings,
+        "granular_markings": [
+            {
+                "marking_ref": "3",
+                "selectors": ["a"],
+            },
+        ],
+    }
+
+    assert markings.get_markings(data, "a", inherited=True) == \
+        ["3"] + [m for m in object_markings if m != "3"]
+
+
 @pytest.mark.parametrize(
     "data,selector", [
         (GET_MARKINGS_TEST_DATA, "foo"),
@@ -325,6 +359,8 @@ def test_get_markings_multiple_selectors(data):
         (GET_MARKINGS_TEST_DATA, "z.y.w"),
         (GET_MARKINGS_TEST_DATA, "x.z.[1]"),
         (GET_MARKINGS_TEST_DATA, "x.z.foo3"),
+        (GET_MARKINGS_TEST_DATA, ["a", "foo"]),
+        (GET_MARKINGS_TEST_DATA, ["x.z.foo1", 1]),
     ],
 )
 def test_get_markings_bad_selector(data, selector):
@@ -841,6 +877,8 @@ def test_is_marked_valid_selector_multiple_refs(data):
     assert markings.is_marked(data, [MARKING_IDS[2], MARKING_IDS[1]], ["malware_types"]) is False
     assert markings.is_marked(data, MARKING_IDS[2], ["malware_types"])
     assert markings.is_marked(data, ["marking-definition--1234"], ["malware_types"]) is False
+    assert markings.is_marked(data, {MARKING_IDS[2], MARKING_IDS[3]}, ["malware_types"])
+    assert markings.is_marked(data, frozenset([MARKING_IDS[2], MARKING_IDS[1]]), ["malware_types"]) is False
 
 
 @pytest.mark.parametrize("data", IS_MARKED_TEST_DATA)
@@ -938,6 +976,11 @@ def test_is_marked_positional_arguments_combinations():
     assert markings.is_marked(test_sdo, "b", inherited=True, descendants=True) is False
     assert markings.is_marked(test_sdo, "b", inherited=False, descendants=True) is False
 
+    assert markings.is_marked(test_sdo, ["2"], "a", False, False) is False
+    assert markings.is_marked(test_sdo, ["2"], "a", True, False) is False
+    assert markings.is_marked(test_sdo, ["2"], "a", True, True) is False
+    assert markings.is_marked(test_sdo, ["2"], "a", False, True) is False
+
     assert markings.is_marked(test_sdo, ["2"], "c", False, False)
     assert markings.is_marked(test_sdo, ["2"], "c", True, False)
     assert markings.is_marked(test_sdo, ["2", "3", "4", "5"], "c", True, True)
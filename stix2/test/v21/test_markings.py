@@ -318,3 +318,35 @@ def test_campaign_with_granular_lang_markings_example():
     # in json.dumps(). https://docs.python.org/3/library/json.html#json.dumps
     # or https://docs.python.org/2/library/json.html#json.dumps
     assert campaign.serialize(pretty=True, ensure_ascii=False) == EXPECTED_CAMPAIGN_WITH_GRANULAR_LANG_MARKINGS
+
+
+def test_markings_mixin_methods_match_module_functions():
+    malware = stix2.v21.Malware(
+        name="Cryptolocker",
+        is_family=False,
+        object_marking_refs=[TLP_WHITE.id],
+        granular_markings=[
+            {
+                "selectors": ["description"],
+                "marking_ref": stix2.v21.TLP_GREEN.id,
+            },
+        ],
+        description="Ransomware",
+    )
+
+    assert malware.get_markings() == stix2.markings.get_markings(malware)
+    assert malware.get_markings("description", inherited=True) == \
+        stix2.markings.get_markings(malware, "description", inherited=True)
+
+    for marking, selectors, inherited, expected in [
+        (None, None, False, True),
+        (TLP_WHITE.id, None, False, True),
+        (stix2.v21.TLP_GREEN.id, None, False, False),
+        (stix2.v21.TLP_GREEN.id, "description", False, True),
+        (TLP_WHITE.id, "description", False, False),
+        ([TLP_WHITE.id, stix2.v21.TLP_GREEN.id], "description", True, True),
+    ]:
+        result = malware.is_marked(marking, selectors, inherited)
+        assert result is expected
+        assert result == \
+            stix2.markings.is_marked(malware, marking, selectors, inherited)
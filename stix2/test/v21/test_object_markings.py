@@ -194,6 +194,15 @@ def test_get_markings_object_marking(data):
     assert set(markings.get_markings(data, None)) == set(["11"])
 
 
+def test_get_markings_object_marking_mapping_with_inner_attr():
+    class MarkedDict(dict):
+        _inner = {}
+
+    data = MarkedDict(object_marking_refs=["11"])
+    assert markings.get_markings(data, None) == ["11"]
+    assert markings.is_marked(data, "11")
+
+
 @pytest.mark.parametrize("data", [GET_MARKINGS_TEST_DATA])
 def test_get_markings_object_and_granular_combinations(data):
     """Test multiple combinations for inherited and descendant markings."""
@@ -356,6 +365,17 @@ def test_remove_markings_bad_markings():
     assert str(excinfo.value) == "Marking ['%s'] was not found in Malware!" % MARKING_IDS[4]
 
 
+def test_remove_markings_bad_markings_keeps_order():
+    before = Malware(
+        object_marking_refs=[MARKING_IDS[0]],
+        **MALWARE_KWARGS
+    )
+    to_remove = [MARKING_IDS[4], MARKING_IDS[3], MARKING_IDS[0]]
+    with pytest.raises(MarkingNotFoundError) as excinfo:
+        markings.remove_markings(before, to_remove, None)
+    assert excinfo.value.key == to_remove
+
+
 @pytest.mark.parametrize(
     "data", [
         (
@@ -462,6 +482,10 @@ def test_is_marked_object_and_granular_combinations():
     assert markings.is_marked(test_sdo, ["11"], "b", True, False)
     assert markings.is_marked(test_sdo, ["11"], "b", True, True)
     assert markings.is_marked(test_sdo, "b", inherited=False, descendants=True) is False
+    assert markings.is_marked(test_sdo, ["12"], "b", True, False) is False
+    assert markings.is_marked(test_sdo, ["12"], "b", True, True) is False
+    assert markings.is_marked(test_sdo, ["11", "12"], "b", True, False) is False
+    assert markings.is_marked(test_sdo, ["1", "12"], "a", True, False) is False
 
     assert markings.is_marked(test_sdo, ["2"], "c", False, False)
     assert markings.is_marked(test_sdo, ["2", "11"], "c", True, False)